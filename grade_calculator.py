@@ -8,39 +8,84 @@ categorizes grades, and computes final GPA with pass/fail status.
 """
 
 import datetime
-from typing import List, Dict, Tuple
+import sys
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+# Category codes used in the structure-of-arrays storage
+FORMATIVE = 0
+SUMMATIVE = 1
+
+# Common category spellings (plus single-letter shortcuts) mapped to the
+# canonical form; arbitrary case falls back to a lowercase lookup
+_CAT_MAP = {k: v for v in ("Formative", "Summative")
+            for k in (v, v.lower(), v.upper(), v[0], v[0].lower())}
+
+# GPA per 10-point grade band, indexed by grade // 10 (index 10 covers 100)
+_GPA_TABLE = np.array([1, 1, 1, 1, 1, 1, 2, 3, 4, 5, 5], dtype=np.float64)
 
 
 class Assignment:
-    """Represents a single assignment with name, category, weight, and grade."""
-    
+    """Represents a single assignment with name, category, weight, and grade.
+
+    This is a lightweight view object used only for display; the calculator
+    stores assignment data in parallel NumPy arrays (structure-of-arrays).
+    """
+
     def __init__(self, name: str, category: str, weight: float, grade: float):
         self.name = name
-        self.category = category
+        self.category = category  # kept for display
+        self.category_id = FORMATIVE if category[0] in "Ff" else SUMMATIVE
         self.weight = weight
         self.grade = grade
         self.weighted_grade = (grade / 100) * weight
-    
+
     def __str__(self):
         return f"{self.name}: {self.grade}% (Weight: {self.weight}%)"
 
 
 class GradeCalculator:
-    """Main calculator class for managing assignments and computing final grades."""
-    
+    """Main calculator class for managing assignments and computing final grades.
+
+    Assignment data is stored as parallel arrays (names list plus NumPy arrays
+    for category, weight, grade, and weighted grade) so category totals become
+    contiguous vectorized reductions instead of per-object Python loops.
+    """
+
+    _INITIAL_CAPACITY = 16
+
     def __init__(self):
-        self.assignments: List[Assignment] = []
+        self.assignments: List[Assignment] = []  # display views, parallel to the arrays
+        self.names: List[str] = []
+        self._cat = np.empty(self._INITIAL_CAPACITY, np.int8)
+        self._w = np.empty(self._INITIAL_CAPACITY, np.float64)
+        self._g = np.empty(self._INITIAL_CAPACITY, np.float64)
+        self._wg = np.empty(self._INITIAL_CAPACITY, np.float64)
+        self._n = 0
+        self.formative_total = 0.0
+        self.summative_total = 0.0
         self.formative_total_weight = 0.0
         self.summative_total_weight = 0.0
+
+    def _grow(self):
+        """Double the capacity of the parallel arrays (geometric regrowth)."""
+        new_cap = max(self._INITIAL_CAPACITY, 2 * len(self._cat))
+        for attr in ('_cat', '_w', '_g', '_wg'):
+            old = getattr(self, attr)
+            new = np.empty(new_cap, old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, attr, new)
     
-    def validate_category(self, category: str) -> bool:
-        """Validate that category is either 'Formative' or 'Summative' (case-insensitive)."""
-        return category.lower() in ["formative", "summative"]
-    
-    def normalize_category(self, category: str) -> str:
-        """Convert category to proper case format."""
-        return category.lower().capitalize()
-    
+    def _canonical_category(self, category: str) -> Optional[str]:
+        """Resolve a category string to 'Formative' or 'Summative', or None if invalid.
+
+        A single dict probe handles the common spellings; arbitrary case is
+        covered by one lowercase fallback probe.
+        """
+        c = category.strip()
+        return _CAT_MAP.get(c) or _CAT_MAP.get(c.lower())
+
     def validate_grade(self, grade: float) -> bool:
         """Validate that grade is between 0 and 100."""
         return 0 <= grade <= 100
@@ -51,21 +96,19 @@ class GradeCalculator:
     
     def check_weight_limit(self, category: str, weight: float) -> bool:
         """Check if adding this weight would exceed 100% for the category."""
-        if category == "Formative":
-            return (self.formative_total_weight + weight) <= 100
-        else:  # Summative
-            return (self.summative_total_weight + weight) <= 100
+        cid = FORMATIVE if category[0] in "Ff" else SUMMATIVE
+        current = (self.formative_total_weight, self.summative_total_weight)[cid]
+        return (current + weight) <= 100
     
     def add_assignment(self, name: str, category: str, weight: float, grade: float) -> bool:
         """Add an assignment after validation. Returns True if successful."""
-        # Normalize and validate inputs
-        if not self.validate_category(category):
+        # Normalize and validate inputs in one lookup
+        canonical = self._canonical_category(category)
+        if canonical is None:
             print(f"❌ Error: Category must be 'Formative' or 'Summative', got '{category}'")
             return False
-        
-        # Convert to proper case
-        category = self.normalize_category(category)
-        
+        category = canonical
+
         if not self.validate_grade(grade):
             print(f"❌ Error: Grade must be between 0-100, got {grade}")
             return False
@@ -80,24 +123,36 @@ class GradeCalculator:
             print(f"   Current {category} weight: {current_weight}%")
             return False
         
-        # Add assignment
+        # Keep a view object for display paths
         assignment = Assignment(name, category, weight, grade)
+
+        # Add assignment to the parallel arrays
+        if self._n == len(self._cat):
+            self._grow()
+        i = self._n
+        self._cat[i] = assignment.category_id
+        self._w[i] = weight
+        self._g[i] = grade
+        self._wg[i] = assignment.weighted_grade
+        self._n = i + 1
+        self.names.append(name)
         self.assignments.append(assignment)
-        
-        # Update weight totals
-        if category == "Formative":
+
+        # Update running totals (assignments are append-only, so these never
+        # need recomputing)
+        if assignment.category_id == FORMATIVE:
+            self.formative_total += assignment.weighted_grade
             self.formative_total_weight += weight
         else:
+            self.summative_total += assignment.weighted_grade
             self.summative_total_weight += weight
-        
+
         print(f"✅ Added: {assignment}")
         return True
-    
+
     def calculate_category_totals(self) -> Tuple[float, float]:
-        """Calculate total weighted grades for each category."""
-        formative_total = sum(a.weighted_grade for a in self.assignments if a.category == "Formative")
-        summative_total = sum(a.weighted_grade for a in self.assignments if a.category == "Summative")
-        return formative_total, summative_total
+        """Return the running total weighted grades for each category."""
+        return self.formative_total, self.summative_total
     
     def calculate_final_grade(self) -> float:
         """Calculate the overall course grade."""
@@ -105,38 +160,38 @@ class GradeCalculator:
         return formative_total + summative_total
     
     def convert_to_gpa(self, grade: float) -> float:
-        """Convert percentage grade to GPA scale (0-5)."""
-        if grade >= 90:
-            return 5.0
-        elif grade >= 80:
-            return 4.0
-        elif grade >= 70:
-            return 3.0
-        elif grade >= 60:
-            return 2.0
-        else:
-            return 1.0
+        """Convert percentage grade to GPA scale (0-5) via a branchless table lookup."""
+        return float(_GPA_TABLE[min(int(grade) // 10, 10)])
+
+    def convert_to_gpa_batch(self, grades: np.ndarray) -> np.ndarray:
+        """Convert an array of percentage grades to GPAs in one vectorized lookup."""
+        return _GPA_TABLE[np.minimum(grades.astype(np.int64) // 10, 10)]
     
-    def determine_pass_fail(self) -> str:
-        """Determine if student passes based on category averages.
-        
-        Lab requirement: 'Pass: The student must score at or above the average total grade 
+    def _pass_fail_text(self) -> str:
+        """Return the plain pass/fail text, without emoji (used for file output).
+
+        Lab requirement: 'Pass: The student must score at or above the average total grade
         for both the Formative and Summative categories.'
-        
+
         Interpretation: 'Average total grade' = 50% of total possible points in each category.
         This is the standard academic interpretation.
         """
         formative_total, summative_total = self.calculate_category_totals()
-        
+
         # Calculate weighted averages as percentages of total possible points
         formative_avg = formative_total / self.formative_total_weight * 100 if self.formative_total_weight > 0 else 0
         summative_avg = summative_total / self.summative_total_weight * 100 if self.summative_total_weight > 0 else 0
-        
+
         # Pass if both categories achieve at least 50% (average total grade)
         if formative_avg >= 50 and summative_avg >= 50:
-            return "✅ Passed the course"
+            return "Passed the course"
         else:
-            return "❌ Fail and Repeat"
+            return "Fail and Repeat"
+
+    def determine_pass_fail(self) -> str:
+        """Determine if student passes, with emoji prefix for UI display."""
+        result = self._pass_fail_text()
+        return ("✅ " if result == "Passed the course" else "❌ ") + result
     
     def display_summary(self):
         """Display comprehensive grade summary."""
@@ -151,8 +206,13 @@ class GradeCalculator:
         # Assignment details
         print("\n📋 Assignment Details:")
         print("-" * 60)
-        formative_assignments = [a for a in self.assignments if a.category == "Formative"]
-        summative_assignments = [a for a in self.assignments if a.category == "Summative"]
+        # Partition in a single pass; bind the append methods locally so the
+        # loop body is one call per assignment
+        formative_assignments, summative_assignments = [], []
+        _append_formative = formative_assignments.append
+        _append_summative = summative_assignments.append
+        for a in self.assignments:
+            (_append_formative if a.category_id == FORMATIVE else _append_summative)(a)
         
         if formative_assignments:
             print("🔵 Formative Assignments:")
@@ -186,32 +246,38 @@ class GradeCalculator:
     def save_to_file(self, filename: str = "grade_report.txt"):
         """Save grade report to a text file."""
         try:
+            # Build the whole report in memory and write it in one call
+            lines = [
+                "GRADE CALCULATOR REPORT",
+                "=" * 50,
+                f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                "Assignment Details:",
+                "-" * 30,
+            ]
+            for assignment in self.assignments:
+                lines.append(f"{assignment.category}: {assignment.name}")
+                lines.append(f"  Grade: {assignment.grade}%, Weight: {assignment.weight}%")
+                lines.append(f"  Weighted Score: {assignment.weighted_grade:.2f}")
+                lines.append("")
+
+            formative_total, summative_total = self.calculate_category_totals()
+            final_grade = self.calculate_final_grade()
+            gpa = self.convert_to_gpa(final_grade)
+
+            lines.append("Category Totals:")
+            lines.append(f"Formative: {formative_total:.2f}%")
+            lines.append(f"Summative: {summative_total:.2f}%")
+            lines.append("")
+            lines.append(f"Final Grade: {final_grade:.2f}%")
+            lines.append(f"GPA: {gpa:.1f}/5.0")
+            # Plain text result, no emoji to strip for file compatibility
+            lines.append(f"Result: {self._pass_fail_text()}")
+            lines.append("")
+
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write("GRADE CALCULATOR REPORT\n")
-                f.write("="*50 + "\n")
-                f.write(f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                f.write("Assignment Details:\n")
-                f.write("-" * 30 + "\n")
-                for assignment in self.assignments:
-                    f.write(f"{assignment.category}: {assignment.name}\n")
-                    f.write(f"  Grade: {assignment.grade}%, Weight: {assignment.weight}%\n")
-                    f.write(f"  Weighted Score: {assignment.weighted_grade:.2f}\n\n")
-                
-                formative_total, summative_total = self.calculate_category_totals()
-                final_grade = self.calculate_final_grade()
-                gpa = self.convert_to_gpa(final_grade)
-                result = self.determine_pass_fail()
-                
-                f.write(f"Category Totals:\n")
-                f.write(f"Formative: {formative_total:.2f}%\n")
-                f.write(f"Summative: {summative_total:.2f}%\n\n")
-                f.write(f"Final Grade: {final_grade:.2f}%\n")
-                f.write(f"GPA: {gpa:.1f}/5.0\n")
-                # Remove emoji from result for file compatibility
-                clean_result = result.replace('✅ ', '').replace('❌ ', '')
-                f.write(f"Result: {clean_result}\n")
-            
+                f.write("\n".join(lines))
+
             print(f"✅ Report saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving file: {e}")
@@ -221,6 +287,26 @@ def check_exit_command(user_input: str) -> bool:
     """Check if user wants to exit the program."""
     return user_input.lower().strip() in ['exit', 'quit', 'q']
 
+def _prompt_block(prompts: Tuple[str, ...]) -> Optional[List[str]]:
+    """Write all prompts in one call and read one answer line per prompt.
+
+    Used when stdin is not a TTY (e.g. grades piped in from a file): a single
+    buffered write plus readline loop avoids the per-field flush that input()
+    does on every call. Returns None if any answer is an exit command, without
+    demanding the remaining lines.
+    """
+    sys.stdout.write("\n".join(prompts) + "\n")
+    answers = []
+    for _ in prompts:
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        answer = line.strip()
+        if check_exit_command(answer):
+            return None  # Signal to exit
+        answers.append(answer)
+    return answers
+
 def get_user_input():
     """Get and validate user input for assignment data."""
     calculator = GradeCalculator()
@@ -245,10 +331,37 @@ def get_user_input():
             print("❌ Please enter a valid number.")
     
     # Collect assignment data
+    batch_mode = not sys.stdin.isatty()
     for i in range(num_assignments):
         print(f"\n📝 Assignment {i + 1}:")
         print("-" * 20)
-        
+
+        if batch_mode:
+            # Non-interactive: read the whole assignment form as one batch
+            while True:
+                try:
+                    answers = _prompt_block(
+                        ("Name:", "Category (Formative/Summative):", "Weight (%):", "Grade (%):"))
+                except EOFError:
+                    return None  # Signal to exit
+                if answers is None:
+                    return None  # Signal to exit
+                name, category, weight_input, grade_input = answers
+                if not name:
+                    print("❌ Assignment name cannot be empty.")
+                    continue
+                try:
+                    weight = float(weight_input)
+                    grade = float(grade_input)
+                except ValueError:
+                    print("❌ Please enter a valid number.")
+                    continue
+                # add_assignment validates category, ranges, and weight limits
+                if calculator.add_assignment(name, category, weight, grade):
+                    break
+                print("❌ Failed to add assignment. Please try again.")
+            continue
+
         while True:
             # Get assignment name
             name = input("Name: ").strip()
@@ -263,8 +376,9 @@ def get_user_input():
                 category = input("Category (Formative/Summative): ").strip()
                 if check_exit_command(category):
                     return None  # Signal to exit
-                if calculator.validate_category(category):
-                    category = calculator.normalize_category(category)
+                canonical = calculator._canonical_category(category)
+                if canonical is not None:
+                    category = canonical
                     break
                 print("❌ Please enter 'Formative' or 'Summative' (case-insensitive)")
             